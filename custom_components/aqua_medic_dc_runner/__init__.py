@@ -4,7 +4,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .client import AquaMedicClient
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL
+from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DATA_POLL_SCHEDULER
+from .scheduler import PollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,6 +13,12 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     _LOGGER.info("🔧 Setting up Aqua Medic integration...")
 
+    # Shared scheduler spreads polls of all entries and limits concurrent requests
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_POLL_SCHEDULER not in domain_data:
+        domain_data[DATA_POLL_SCHEDULER] = PollScheduler(hass)
+    scheduler = domain_data[DATA_POLL_SCHEDULER]
+
     # Check if we have new token-based configuration or old username/password
     if "token" in entry.data:
         # New token-based setup
@@ -23,7 +30,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         client.token = token
         
         # Test the connection
-        test_data = await client.get_latest_device_data(device_id)
+        test_data = await scheduler.async_poll(client.get_latest_device_data, device_id)
         if not test_data:
             _LOGGER.error("❌ Failed to connect with provided token.")
             return False
@@ -47,13 +54,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         device_id = devices[0]["did"]
     
-    # Create standard coordinator
+    # Create standard coordinator; its polls are timed by the scheduler, so it
+    # gets no update_interval of its own
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name="aqua_medic_shared_coordinator",
-        update_method=lambda: client.get_latest_device_data(device_id),
-        update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+        update_method=lambda: scheduler.async_poll(client.get_latest_device_data, device_id),
+        update_interval=None,
     )
     
     await coordinator.async_config_entry_first_refresh()
@@ -62,7 +70,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     coordinator.async_add_listener(lambda: None)
     
     # Store both client and coordinator
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    domain_data[entry.entry_id] = {
         "client": client,
         "coordinator": coordinator
     }
@@ -77,6 +85,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Ensure all entities register
     await hass.config_entries.async_forward_entry_setups(entry, ["number", "switch"])
 
+    # Only schedule polls once setup can no longer fail, as a failed setup is never unloaded
+    scheduler.async_register(entry.entry_id, coordinator, timedelta(seconds=DEFAULT_UPDATE_INTERVAL))
+
     _LOGGER.info("✅ Aqua Medic integration set up successfully!")
     return True
 
@@ -95,5 +106,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Stop scheduling polls for this entry
+        scheduler = hass.data[DOMAIN].get(DATA_POLL_SCHEDULER)
+        if scheduler:
+            scheduler.async_unregister(entry.entry_id)
+            if scheduler.is_empty:
+                hass.data[DOMAIN].pop(DATA_POLL_SCHEDULER)
     
     return unload_ok
\ No newline at end of file
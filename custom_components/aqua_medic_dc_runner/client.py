@@ -8,10 +8,11 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class AquaMedicClient:
-    def __init__(self, username, password, app_id):
+    def __init__(self, username, password, app_id, base_url=API_BASE_URL):
         self.username = username
         self.password = password
         self.app_id = app_id
+        self.base_url = base_url.rstrip("/")
         self.token = None
         self.uid = None
         self.session = None
@@ -36,7 +37,7 @@ class AquaMedicClient:
         
         _LOGGER.info(f"🔧 Provisioning device with App ID: {self.app_id}")
         
-        url = f"{API_BASE_URL}/app/provision"
+        url = f"{self.base_url}/app/provision"
         payload = {
             "phone_id": phone_id,
             "os": "Linux",
@@ -88,7 +89,7 @@ class AquaMedicClient:
 
         _LOGGER.info(f"🔐 Attempting login with username: {self.username} and App ID: {self.app_id}")
 
-        url = f"{API_BASE_URL}/app/login"
+        url = f"{self.base_url}/app/login"
         payload = {"username": self.username, "password": self.password}
         headers = {
             "Content-Type": "application/json", 
@@ -121,7 +122,7 @@ class AquaMedicClient:
             _LOGGER.error("❌ Cannot fetch devices: No token. Authentication required.")
             return None
 
-        url = f"http://euapi.gizwits.com/app/bindings?limit=10"
+        url = f"{self.base_url}/app/bindings?limit=10"
         headers = {
             "X-Gizwits-Application-Id": self.app_id,
             "X-Gizwits-User-token": self.token
@@ -149,7 +150,7 @@ class AquaMedicClient:
         """Fetch the latest state of the device."""
         await self.ensure_session()  # ✅ Ensure session is open before request
 
-        url = f"http://euapi.gizwits.com/app/devdata/{device_id}/latest"
+        url = f"{self.base_url}/app/devdata/{device_id}/latest"
         headers = {
             "X-Gizwits-Application-Id": self.app_id,
             "X-Gizwits-User-token": self.token,
@@ -172,7 +173,7 @@ class AquaMedicClient:
             }
         }
 
-        url = f"http://euapi.gizwits.com/app/control/{device_id}"
+        url = f"{self.base_url}/app/control/{device_id}"
         headers = {
             "X-Gizwits-Application-Id": self.app_id,
             "X-Gizwits-User-token": self.token,
@@ -195,7 +196,7 @@ class AquaMedicClient:
             }
         }
 
-        url = f"http://euapi.gizwits.com/app/control/{device_id}"
+        url = f"{self.base_url}/app/control/{device_id}"
         headers = {
             "X-Gizwits-Application-Id": self.app_id,
             "X-Gizwits-User-token": self.token,
@@ -218,7 +219,7 @@ class AquaMedicClient:
 
     async def get_power_state(self, device_id):
         """Fetch the current power state from API."""
-        url = f"http://euapi.gizwits.com/app/devdata/{device_id}/latest"
+        url = f"{self.base_url}/app/devdata/{device_id}/latest"
         headers = {"X-Gizwits-User-token": self.token, "Content-Type": "application/json"}
 
         async with self.session.get(url, headers=headers) as resp:
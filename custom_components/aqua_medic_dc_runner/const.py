@@ -7,3 +7,8 @@ CONF_UID = "uid"
 API_BASE_URL = "http://euapi.gizwits.com"
 DEFAULT_APP_ID = "07452c4f036a4be3acedf8dbeef38320"  # ✅ Updated app ID from mobile app traffic
 DEFAULT_UPDATE_INTERVAL = 30
+MAX_CONCURRENT_POLLS = 4  # Cap on simultaneous poll requests across all entries
+POLL_REQUEST_TIMEOUT = 10  # Seconds a poll may hold a concurrency slot before it is abandoned
+POLL_PHASE_JITTER = 0.2  # Random phase offset as a fraction of one device's slot
+POLL_REBALANCE_DELAY = 5  # Seconds to wait for further entries before re-spreading phases
+DATA_POLL_SCHEDULER = "poll_scheduler"
@@ -3,7 +3,7 @@ import asyncio
 from datetime import timedelta
 from homeassistant.components.number import NumberEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL
+from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DATA_POLL_SCHEDULER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,6 +13,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
     client = data["client"]
     coordinator = data["coordinator"]
+    scheduler = hass.data[DOMAIN][DATA_POLL_SCHEDULER]
 
     # Get device_id from configuration (token-based setup) or legacy device list
     if "device_id" in entry.data:
@@ -26,7 +27,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         device_id = devices[0]["did"]
 
     async_add_entities([
-        AquaMedicMotorSpeed(client, device_id, coordinator, entry),
+        AquaMedicMotorSpeed(client, scheduler, device_id, coordinator, entry),
         AquaMedicUpdateInterval(entry, device_id)
     ])
 
@@ -34,10 +35,11 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class AquaMedicMotorSpeed(CoordinatorEntity, NumberEntity):
     """Number entity to control Aqua Medic motor speed."""
 
-    def __init__(self, client, device_id, coordinator, entry):
+    def __init__(self, client, scheduler, device_id, coordinator, entry):
         """Initialize the number entity."""
         super().__init__(coordinator, context=device_id)
         self._client = client
+        self._scheduler = scheduler
         self._device_id = device_id
         self._attr_name = "Speed"
         self._attr_unique_id = f"aqua_medic_dc_runner_{device_id}_speed"
@@ -107,8 +109,10 @@ class AquaMedicMotorSpeed(CoordinatorEntity, NumberEntity):
                 for attempt in range(5):
                     await asyncio.sleep(2)
                     
-                    # Force a fresh API call
-                    new_data = await self._client.get_latest_device_data(self._device_id)
+                    # Force a fresh API call, sharing the poll concurrency limit
+                    new_data = await self._scheduler.async_poll(
+                        self._client.get_latest_device_data, self._device_id
+                    )
                     if new_data and "attr" in new_data:
                         actual_speed = new_data["attr"].get("Motor_Speed")
                         _LOGGER.info(f"Attempt {attempt + 1}: API reports speed={actual_speed}, expected={value}")
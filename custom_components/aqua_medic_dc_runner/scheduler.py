@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import random
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from .const import MAX_CONCURRENT_POLLS, POLL_PHASE_JITTER, POLL_REBALANCE_DELAY, POLL_REQUEST_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollScheduler:
+    """Spreads coordinator polls of all config entries over the update interval.
+
+    Without this every entry's coordinator is set up at roughly the same time
+    and polls the cloud in lockstep. Registered coordinators are created
+    without an update interval of their own; the scheduler triggers their
+    refreshes on fixed ticks (base + slot offset + k * interval), so each entry
+    keeps its phase slot (plus some jitter) regardless of request latency. It
+    also limits how many poll requests may be in flight at once.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent=MAX_CONCURRENT_POLLS, jitter=POLL_PHASE_JITTER):
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._jitter = jitter
+        self._coordinators = {}
+        self._intervals = {}
+        self._unsub_rebalance = None
+        self._unsub_tick = {}
+        self._refreshing = set()
+
+    @property
+    def is_empty(self):
+        return not self._coordinators
+
+    async def async_poll(self, update_method, *args):
+        """Run a poll request, waiting for a free slot if too many are in flight."""
+        async with self._semaphore:
+            # A hung request must not keep the shared slot for other entries
+            async with asyncio.timeout(POLL_REQUEST_TIMEOUT):
+                return await update_method(*args)
+
+    @callback
+    def async_register(self, entry_id, coordinator, update_interval):
+        """Poll a coordinator every update_interval and re-spread the phases once setup settles."""
+        self._coordinators[entry_id] = coordinator
+        self._intervals[entry_id] = update_interval.total_seconds()
+        self._async_schedule_rebalance()
+
+    @callback
+    def async_unregister(self, entry_id):
+        """Stop polling a coordinator and re-spread the remaining ones."""
+        self._coordinators.pop(entry_id, None)
+        self._intervals.pop(entry_id, None)
+        self._async_cancel_tick(entry_id)
+        if self._coordinators:
+            self._async_schedule_rebalance()
+        elif self._unsub_rebalance:
+            self._unsub_rebalance()
+            self._unsub_rebalance = None
+
+    @callback
+    def _async_schedule_rebalance(self):
+        # Debounce so entries set up one after another are spread only once
+        if self._unsub_rebalance:
+            self._unsub_rebalance()
+        self._unsub_rebalance = async_call_later(self._hass, POLL_REBALANCE_DELAY, self._async_rebalance)
+
+    @callback
+    def _async_cancel_tick(self, entry_id):
+        unsub = self._unsub_tick.pop(entry_id, None)
+        if unsub:
+            unsub()
+
+    @staticmethod
+    def _is_polling(coordinator):
+        config_entry = getattr(coordinator, "config_entry", None)
+        return not (config_entry and config_entry.pref_disable_polling)
+
+    @callback
+    def _async_rebalance(self, _now):
+        """Assign every coordinator its own slot within the interval."""
+        self._unsub_rebalance = None
+        base = self._hass.loop.time()
+        eligible = []
+        for entry_id, coordinator in sorted(self._coordinators.items()):
+            if self._is_polling(coordinator):
+                eligible.append((entry_id, coordinator))
+            else:
+                self._async_cancel_tick(entry_id)
+
+        for index, (entry_id, coordinator) in enumerate(eligible):
+            interval = self._intervals[entry_id]
+            slot = interval / len(eligible)
+            offset = index * slot + random.uniform(0, self._jitter * slot)
+            self._async_schedule_tick(entry_id, coordinator, base + offset)
+            _LOGGER.debug("⏱️ Poll phase for %s set to %.1fs of %ss", entry_id, offset, interval)
+
+    @callback
+    def _async_schedule_tick(self, entry_id, coordinator, when):
+        """Schedule the refresh of a coordinator at loop time `when`."""
+        self._async_cancel_tick(entry_id)
+        delay = max(0.0, when - self._hass.loop.time())
+        self._unsub_tick[entry_id] = async_call_later(
+            self._hass, delay, self._make_tick(entry_id, coordinator, when)
+        )
+
+    def _make_tick(self, entry_id, coordinator, when):
+        async def _tick(_now):
+            self._unsub_tick.pop(entry_id, None)
+            interval = self._intervals.get(entry_id)
+            if interval is None:
+                return
+
+            # Next tick is derived from the fixed schedule, not from when this
+            # refresh finishes, so latency and slot waits never shift the phase.
+            # Ticks missed while the loop was busy are skipped.
+            next_when = when + interval
+            now = self._hass.loop.time()
+            while next_when <= now:
+                next_when += interval
+            self._async_schedule_tick(entry_id, coordinator, next_when)
+
+            if entry_id in self._refreshing:
+                _LOGGER.debug("⏭️ Previous poll for %s still running, skipping tick", entry_id)
+                return
+            self._refreshing.add(entry_id)
+            try:
+                await coordinator.async_refresh()
+            finally:
+                self._refreshing.discard(entry_id)
+
+        return _tick
@@ -3,7 +3,7 @@ import asyncio
 from datetime import timedelta, datetime
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
-from .const import DOMAIN
+from .const import DOMAIN, DATA_POLL_SCHEDULER
 from .client import AquaMedicClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,6 +14,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     data = hass.data[DOMAIN][entry.entry_id]
     client = data["client"]
     coordinator = data["coordinator"]
+    scheduler = hass.data[DOMAIN][DATA_POLL_SCHEDULER]
 
     # Get device_id from configuration (token-based setup) or legacy device list
     if "device_id" in entry.data:
@@ -26,16 +27,17 @@ async def async_setup_entry(hass, entry, async_add_entities):
             return
         device_id = devices[0]["did"]
 
-    async_add_entities([AquaMedicPowerSwitch(client, device_id, coordinator, entry)])
+    async_add_entities([AquaMedicPowerSwitch(client, scheduler, device_id, coordinator, entry)])
 
 
 class AquaMedicPowerSwitch(CoordinatorEntity, SwitchEntity):
     """Switch entity to control Aqua Medic power."""
 
-    def __init__(self, client, device_id, coordinator, entry):
+    def __init__(self, client, scheduler, device_id, coordinator, entry):
         """Initialize the switch."""
         super().__init__(coordinator)
         self._client = client
+        self._scheduler = scheduler
         self._device_id = device_id
         self._attr_name = "Power"
         self._attr_unique_id = f"aqua_medic_dc_runner_{device_id}_power"
@@ -138,7 +140,9 @@ class AquaMedicPowerSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_update(self):
         """Manually force a state update from the API when Home Assistant requests it."""
-        new_state = await self._client.get_latest_device_data(self._device_id)
+        new_state = await self._scheduler.async_poll(
+            self._client.get_latest_device_data, self._device_id
+        )
 
         if new_state and "attr" in new_state:
             self.coordinator.data = new_state
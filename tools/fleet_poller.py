@@ -0,0 +1,339 @@
+"""Headless fleet poller / load-test CLI for Aqua Medic DC Runner pumps.
+
+Uses the integration's AquaMedicClient without Home Assistant. Polls a list
+of pumps concurrently, streams state changes as JSON lines on stdout and
+prints a throughput/latency summary when done.
+
+Lives outside custom_components/ so it is not shipped to HACS users.
+
+Examples:
+    python tools/fleet_poller.py --token TOKEN --device DID1 --device DID2
+    python tools/fleet_poller.py --pumps pumps.json --concurrency 8 --interval 10 --duration 300
+    python tools/fleet_poller.py --pumps pumps.json --base-url http://127.0.0.1:8080 \\
+        --command speed:60 --command power:on --command-interval 5
+
+The pumps file is a JSON list of objects with "device_id", "token" and an
+optional "app_id".
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import math
+import sys
+import time
+import types
+from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE = "aqua_medic_dc_runner"
+_COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / _PACKAGE
+
+
+def _load_integration():
+    """Import the integration's client and const modules without Home Assistant.
+
+    client.py imports const via a relative import, so the modules must be
+    loaded as submodules of the aqua_medic_dc_runner package. Importing that
+    package normally would run its __init__.py, which requires Home Assistant.
+    Instead an empty package module pointing at the component directory is
+    registered in sys.modules, and only client.py and const.py are executed.
+    """
+    if not (_COMPONENT_DIR / "client.py").is_file():
+        raise SystemExit(f"Integration not found at {_COMPONENT_DIR}")
+    if _PACKAGE not in sys.modules:
+        package = types.ModuleType(_PACKAGE)
+        package.__path__ = [str(_COMPONENT_DIR)]
+        sys.modules[_PACKAGE] = package
+    client = importlib.import_module(f"{_PACKAGE}.client")
+    const = importlib.import_module(f"{_PACKAGE}.const")
+    return client.AquaMedicClient, const
+
+
+class Stats:
+    """Collects request counts and latencies per operation."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, op, latency, ok):
+        self.latencies.setdefault(op, []).append(latency)
+        if not ok:
+            self.errors[op] = self.errors.get(op, 0) + 1
+
+    @staticmethod
+    def _percentile(values, pct):
+        # Nearest-rank percentile
+        index = min(len(values) - 1, max(0, math.ceil(pct * len(values) / 100) - 1))
+        return values[index]
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        ops = {}
+        total = 0
+        for op, values in self.latencies.items():
+            values = sorted(values)
+            total += len(values)
+            ops[op] = {
+                "requests": len(values),
+                "errors": self.errors.get(op, 0),
+                "throughput_rps": round(len(values) / elapsed, 3) if elapsed else 0.0,
+                "latency_ms": {
+                    "min": round(values[0] * 1000, 1),
+                    "p50": round(self._percentile(values, 50) * 1000, 1),
+                    "p95": round(self._percentile(values, 95) * 1000, 1),
+                    "p99": round(self._percentile(values, 99) * 1000, 1),
+                    "max": round(values[-1] * 1000, 1),
+                },
+            }
+        return {
+            "event": "summary",
+            "elapsed_s": round(elapsed, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(total / elapsed, 3) if elapsed else 0.0,
+            "operations": ops,
+        }
+
+
+def emit(record):
+    """Write one JSON line to stdout."""
+    sys.stdout.write(json.dumps(record, sort_keys=True) + "\n")
+    sys.stdout.flush()
+
+
+def parse_command(value):
+    """Parse an ACTION:VALUE command such as speed:60 or power:on."""
+    action, _, arg = value.partition(":")
+    action = action.strip().lower()
+    if action == "speed":
+        try:
+            speed = int(arg)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid speed in {value!r}")
+        if not 30 <= speed <= 100:
+            raise argparse.ArgumentTypeError("speed must be between 30 and 100")
+        return action, speed
+    if action == "power":
+        if arg.lower() not in ("on", "off"):
+            raise argparse.ArgumentTypeError("power must be 'on' or 'off'")
+        return action, arg.lower() == "on"
+    raise argparse.ArgumentTypeError(f"unknown command {value!r}, use speed:N or power:on|off")
+
+
+def load_pumps(args, default_app_id):
+    """Build the list of pumps from --pumps and/or --device arguments."""
+    pumps = []
+    if args.pumps:
+        with open(args.pumps) as fh:
+            for item in json.load(fh):
+                pumps.append({
+                    "device_id": item["device_id"],
+                    "token": item.get("token", args.token),
+                    "app_id": item.get("app_id", args.app_id or default_app_id),
+                })
+    for device_id in args.device or []:
+        pumps.append({
+            "device_id": device_id,
+            "token": args.token,
+            "app_id": args.app_id or default_app_id,
+        })
+    for pump in pumps:
+        if not pump["token"]:
+            raise SystemExit(f"No token for device {pump['device_id']} (use --token or the pumps file)")
+    return pumps
+
+
+class FleetPoller:
+    """Polls a fleet of pumps with bounded parallelism."""
+
+    def __init__(self, client_cls, pumps, args):
+        self._pumps = pumps
+        self._args = args
+        self._semaphore = asyncio.Semaphore(args.concurrency)
+        self.stats = Stats()
+        self._last_state = {}
+        # One client (and aiohttp session) per credential set
+        self._clients = {}
+        for pump in pumps:
+            key = (pump["app_id"], pump["token"])
+            if key not in self._clients:
+                client = client_cls(None, None, pump["app_id"], base_url=args.base_url)
+                client.token = pump["token"]
+                self._clients[key] = client
+
+    def _client_for(self, pump):
+        return self._clients[(pump["app_id"], pump["token"])]
+
+    async def _timed(self, op, device_id, coro):
+        """Run one API call under the concurrency limit and record its latency."""
+        async with self._semaphore:
+            start = time.perf_counter()
+            error = None
+            try:
+                result = await asyncio.wait_for(coro, self._args.timeout)
+            except Exception as err:
+                # Malformed bodies (JSONDecodeError) etc. count as failed requests
+                # instead of aborting the whole run
+                result = None
+                error = repr(err)
+            latency = time.perf_counter() - start
+        # The client returns None/False on failure; an empty body is still a reply
+        ok = result is not None and result is not False
+        self.stats.record(op, latency, ok)
+        if not ok:
+            emit({
+                "event": "error",
+                "op": op,
+                "device_id": device_id,
+                "latency_ms": round(latency * 1000, 1),
+                "error": error or "request failed",
+                "ts": time.time(),
+            })
+        return result
+
+    async def _poll_one(self, pump):
+        device_id = pump["device_id"]
+        data = await self._timed(
+            "poll", device_id, self._client_for(pump).get_latest_device_data(device_id)
+        )
+        if not isinstance(data, dict):
+            return
+        state = data.get("attr", {})
+        previous = self._last_state.get(device_id)
+        if state != previous:
+            self._last_state[device_id] = state
+            changed = {
+                key: value for key, value in state.items()
+                if previous is None or previous.get(key) != value
+            }
+            emit({
+                "event": "state",
+                "device_id": device_id,
+                "changed": changed,
+                "state": state,
+                "ts": time.time(),
+            })
+
+    async def _poll_loop(self, deadline):
+        rounds = 0
+        while True:
+            round_start = time.monotonic()
+            await asyncio.gather(*(self._poll_one(pump) for pump in self._pumps))
+            rounds += 1
+            if self._args.rounds and rounds >= self._args.rounds:
+                return
+            next_round = round_start + self._args.interval
+            if deadline and next_round >= deadline:
+                return
+            await asyncio.sleep(max(0.0, next_round - time.monotonic()))
+
+    async def _command_loop(self):
+        step = 0
+        while True:
+            # Send each command to every pump before moving on to the next one
+            pump = self._pumps[step % len(self._pumps)]
+            commands = self._args.command
+            action, value = commands[(step // len(self._pumps)) % len(commands)]
+            client = self._client_for(pump)
+            device_id = pump["device_id"]
+            if action == "speed":
+                coro = client.set_motor_speed(device_id, value)
+            else:
+                coro = client.set_power(device_id, value)
+            result = await self._timed(f"command_{action}", device_id, coro)
+            emit({
+                "event": "command",
+                "device_id": device_id,
+                "action": action,
+                "value": value,
+                "ok": result is not None and result is not False,
+                "ts": time.time(),
+            })
+            step += 1
+            await asyncio.sleep(self._args.command_interval)
+
+    async def run(self):
+        for client in self._clients.values():
+            await client.ensure_session()
+        deadline = time.monotonic() + self._args.duration if self._args.duration else None
+        command_task = None
+        if self._args.command:
+            command_task = asyncio.create_task(self._command_loop())
+        try:
+            await self._poll_loop(deadline)
+        finally:
+            if command_task:
+                command_task.cancel()
+                await asyncio.gather(command_task, return_exceptions=True)
+            for client in self._clients.values():
+                await client.close()
+        return self.stats.summary()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Poll a fleet of Aqua Medic DC Runner pumps and report throughput/latency."
+    )
+    parser.add_argument("--pumps", help="JSON file with a list of {device_id, token, app_id}")
+    parser.add_argument("--device", action="append", help="Device ID to poll (repeatable)")
+    parser.add_argument("--token", help="User token for --device entries and pumps without one")
+    parser.add_argument("--app-id", help="Gizwits application ID (default: integration default)")
+    parser.add_argument("--base-url", help="API base URL, e.g. a local stand-in server")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max in-flight requests (default: 4)")
+    parser.add_argument("--interval", type=float, default=30.0, help="Seconds between poll rounds (default: 30)")
+    parser.add_argument("--rounds", type=int, default=0, help="Stop after N poll rounds (0 = unlimited)")
+    parser.add_argument("--duration", type=float, default=0.0, help="Stop after N seconds (0 = unlimited)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument(
+        "--command", action="append", type=parse_command,
+        help="Scripted command ACTION:VALUE (speed:60, power:on|off), repeatable; "
+             "sent round-robin across pumps",
+    )
+    parser.add_argument(
+        "--command-interval", type=float, default=10.0,
+        help="Seconds between scripted commands (default: 10)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable client logging on stderr")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if args.concurrency < 1:
+        raise SystemExit("--concurrency must be at least 1")
+
+    client_cls, const = _load_integration()
+    args.base_url = args.base_url or const.API_BASE_URL
+    pumps = load_pumps(args, const.DEFAULT_APP_ID)
+    if not pumps:
+        raise SystemExit("No pumps given (use --pumps and/or --device)")
+    if not args.rounds and not args.duration:
+        _LOGGER.warning("No --rounds or --duration given, polling until interrupted")
+
+    poller = FleetPoller(client_cls, pumps, args)
+    aborted = None
+    try:
+        summary = asyncio.run(poller.run())
+    except KeyboardInterrupt:
+        summary = poller.stats.summary()
+    except Exception as err:
+        _LOGGER.exception("Fleet run aborted")
+        aborted = repr(err)
+        summary = poller.stats.summary()
+        summary["aborted"] = aborted
+    emit(summary)
+    return 1 if summary["errors"] or aborted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())